@@ -52,6 +52,10 @@ def render_database_management():
                         session.query(EmployeeTable).delete()
                         session.commit()
                     
+                    # Cached lookups and stats still describe the deleted rows
+                    from src.database.repository import EmployeeRepository
+                    EmployeeRepository.clear_cache()
+                    
                     st.session_state.confirm_clear_all = False
                     st.success("All data cleared successfully")
                     st.rerun()
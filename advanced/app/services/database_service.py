@@ -30,7 +30,12 @@ def get_database_manager_cached():
 
 @contextmanager
 def get_employee_repository() -> Generator[Tuple[EmployeeRepository, any], None, None]:
-    """Context manager for employee repository with automatic session cleanup."""
+    """
+    Context manager for employee repository with automatic session cleanup.
+    
+    The block runs as one transaction: it is committed when the block exits
+    normally and rolled back if it raises.
+    """
     db_manager = get_database_manager_cached()
     if not db_manager:
         raise Exception("Database not available")
@@ -38,6 +43,10 @@ def get_employee_repository() -> Generator[Tuple[EmployeeRepository, any], None,
     session = db_manager.get_session()
     try:
         yield EmployeeRepository(session), session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
     finally:
         session.close()
 
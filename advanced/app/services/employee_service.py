@@ -44,10 +44,11 @@ class EmployeeService:
             }
     
     def get_employees_list(self, limit: int = 50, offset: int = 0, 
-                          status: Optional[EmploymentStatus] = None) -> Dict[str, Any]:
-        """Get paginated list of employees."""
+                          status: Optional[EmploymentStatus] = None,
+                          after_id: Optional[int] = None) -> Dict[str, Any]:
+        """Get paginated list of employees (offset- or cursor-based)."""
         with get_employee_repository() as (emp_repo, session):
-            result = emp_repo.list(limit=limit, skip=offset, status=status)
+            result = emp_repo.list(limit=limit, skip=offset, status=status, after_id=after_id)
             # result is now a dictionary, not an object with attributes
             return result
     
@@ -6,19 +6,40 @@ using SQLAlchemy with SQLite for local development.
 """
 
 import os
+import time
 import logging
 from pathlib import Path
 from typing import Generator, Optional
 from contextlib import contextmanager
+from functools import partial
 
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import create_engine, event, make_url, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.engine import Engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from .models import Base, POSTGRES_BATCH_SIZE, upgrade_legacy_employees
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Fixed statements used by connection and health checks
+_SELECT_1 = text("SELECT 1")
+_PRAGMA_DB_LIST = text("PRAGMA database_list")
+_PRAGMA_COMPILE = text("PRAGMA compile_options")
+
+# Shared session factory; each manager binds it to its own engine per session
+_SessionFactory = sessionmaker(autocommit=False, autoflush=False)
+
+# Echo SQL statements when DATABASE_DEBUG=true
+_DB_DEBUG = os.getenv("DATABASE_DEBUG", "false").lower() == "true"
+
+
+def _is_memory_database(database_url: str) -> bool:
+    """Whether a SQLite URL names an in-memory database (sqlite://, :memory:, mode=memory)."""
+    url = make_url(database_url)
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
 
 class DatabaseManager:
     """
@@ -37,16 +58,14 @@ class DatabaseManager:
         if database_url is None:
             # Create database directory if it doesn't exist
             db_dir = Path("data")
-            db_dir.mkdir(exist_ok=True)
+            if not db_dir.is_dir():
+                db_dir.mkdir(parents=True, exist_ok=True)
             database_url = f"sqlite:///data/app.db"
         
         self.database_url = database_url
         self.engine = self._create_engine()
-        self.SessionLocal = sessionmaker(
-            autocommit=False, 
-            autoflush=False, 
-            bind=self.engine
-        )
+        # Reuse the shared factory; only the bind differs per manager
+        self.SessionLocal = partial(_SessionFactory, bind=self.engine)
         
         # Configure SQLite for better concurrency
         if "sqlite" in database_url:
@@ -54,25 +73,38 @@ class DatabaseManager:
     
     def _create_engine(self) -> Engine:
         """Create and configure database engine."""
+        engine_kwargs = {"echo": _DB_DEBUG}
+        
+        if self.database_url.startswith("postgresql"):
+            # Rows per multi-VALUES INSERT when executing bulk inserts; SQLite
+            # only pages INSERT..RETURNING this way, so it keeps the default
+            engine_kwargs["insertmanyvalues_page_size"] = POSTGRES_BATCH_SIZE
+        
+        if make_url(self.database_url).get_driver_name() == "psycopg2":
+            # Batch executemany() into multi-VALUES statements
+            engine_kwargs["executemany_mode"] = "values_plus_batch"
+        
         if "sqlite" in self.database_url:
             # SQLite specific configuration
-            engine = create_engine(
-                self.database_url,
-                connect_args={
-                    "check_same_thread": False,  # Allow multiple threads
-                    "timeout": 30,  # Connection timeout in seconds
-                },
-                poolclass=StaticPool,  # Use static pool for SQLite
-                echo=os.getenv("DATABASE_DEBUG", "false").lower() == "true"
-            )
-        else:
-            # Generic database configuration
-            engine = create_engine(
-                self.database_url,
-                echo=os.getenv("DATABASE_DEBUG", "false").lower() == "true"
-            )
+            engine_kwargs["connect_args"] = {
+                "check_same_thread": False,  # Allow multiple threads
+                "timeout": 30,  # Connection timeout in seconds
+            }
+            
+            if _is_memory_database(self.database_url):
+                # In-memory databases live on a single connection
+                engine_kwargs["poolclass"] = StaticPool
+            else:
+                # WAL mode allows concurrent readers, so pool connections
+                engine_kwargs.update(
+                    poolclass=QueuePool,
+                    pool_size=max(4, os.cpu_count() or 4),
+                    max_overflow=8,
+                    pool_recycle=3600,
+                    pool_pre_ping=False,
+                )
         
-        return engine
+        return create_engine(self.database_url, **engine_kwargs)
     
     def _configure_sqlite(self) -> None:
         """Configure SQLite specific settings."""
@@ -128,14 +160,15 @@ class DatabaseManager:
             session.close()
     
     def create_tables(self) -> None:
-        """Create all database tables."""
-        from .models import Base
+        """Create all database tables, upgrading a legacy employees table first."""
+        migrated = upgrade_legacy_employees(self.engine)
+        if migrated:
+            logger.info(f"Upgraded {migrated} employees to the current schema")
         Base.metadata.create_all(bind=self.engine)
         logger.info("Database tables created successfully")
     
     def drop_tables(self) -> None:
         """Drop all database tables."""
-        from .models import Base
         Base.metadata.drop_all(bind=self.engine)
         logger.info("Database tables dropped successfully")
     
@@ -152,8 +185,9 @@ class DatabaseManager:
             True if connection successful, False otherwise
         """
         try:
-            with self.session_scope() as session:
-                session.execute(text("SELECT 1"))
+            # A plain connection is enough here; no ORM session is needed
+            with self.engine.connect() as conn:
+                conn.execute(_SELECT_1)
             logger.info("Database connection test successful")
             return True
         except Exception as e:
@@ -170,7 +204,10 @@ class DatabaseManager:
         info = {
             "database_url": self.database_url,
             "engine": str(self.engine),
-            "pool_size": getattr(self.engine.pool, 'size', 'N/A'),
+            "pool_size": (
+                self.engine.pool.size()
+                if isinstance(self.engine.pool, QueuePool) else 'N/A'
+            ),
             "connection_test": self.test_connection()
         }
         
@@ -178,11 +215,11 @@ class DatabaseManager:
             # Add SQLite specific info
             try:
                 with self.session_scope() as session:
-                    result = session.execute(text("PRAGMA database_list")).fetchall()
-                    info["sqlite_databases"] = [dict(row._mapping) for row in result]
+                    result = session.execute(_PRAGMA_DB_LIST)
+                    info["sqlite_databases"] = result.mappings().all()
                     
-                    result = session.execute(text("PRAGMA compile_options")).fetchall()
-                    info["sqlite_compile_options"] = [row[0] for row in result]
+                    result = session.execute(_PRAGMA_COMPILE)
+                    info["sqlite_compile_options"] = result.scalars().all()
             except Exception as e:
                 logger.warning(f"Could not get SQLite info: {e}")
         
@@ -273,14 +310,14 @@ def check_database_health() -> dict:
         health_status = {
             "status": "healthy" if info["connection_test"] else "unhealthy",
             "database_url": info["database_url"],
-            "timestamp": os.times(),
+            "timestamp": time.time_ns(),
             "details": info
         }
     except Exception as e:
         health_status = {
             "status": "error",
             "error": str(e),
-            "timestamp": os.times()
+            "timestamp": time.time_ns()
         }
     
     return health_status
\ No newline at end of file
@@ -6,31 +6,122 @@ that correspond to our Pydantic models for data validation.
 """
 
 from datetime import datetime, date
-from decimal import Decimal
-from typing import Optional
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime, Date, 
-    Numeric, ForeignKey, JSON, Enum as SQLEnum
+    BigInteger, Integer, SmallInteger, String, Text, DateTime, Date, 
+    ForeignKey, JSON, CheckConstraint, DDL, Index, MetaData, Table, bindparam,
+    event, insert, inspect, literal, select, union_all, update
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, Session
-from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
+from sqlalchemy.orm import (
+    DeclarativeBase, Mapped, mapped_column,
+    backref, relationship, selectinload, Session
+)
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.sql import func, text
 
 from ..models.employee import Department, EmploymentStatus
 
 # Create base class for all models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
+
+
+# Rows per executemany() call in insert_employee_rows
+BATCH_SIZE = 10_000
+# Rows per multi-VALUES INSERT page on PostgreSQL (insertmanyvalues_page_size)
+POSTGRES_BATCH_SIZE = 1_000
+
+# Deferred column group holding the JSON columns
+JSON_GROUP = "json"
+
+# JSON everywhere, binary JSONB on PostgreSQL so containment queries can use GIN
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class EnumOrdinal(TypeDecorator):
+    """
+    Store a Python Enum as a SmallInteger ordinal.
+    
+    Members are numbered in definition order, so new members must only
+    ever be appended. Application code keeps reading and writing the
+    Enum members (or their values) unchanged.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._ordinals = {member: i for i, member in enumerate(self._members)}
+
+    def ordinal(self, member) -> int:
+        """Get the stored integer for an enum member or value."""
+        return self._ordinals[self.enum_class(member)]
+
+    @property
+    def max_ordinal(self) -> int:
+        """Highest stored integer, for CHECK constraints."""
+        return len(self._members) - 1
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.ordinal(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
+
+
+class MoneyCents(TypeDecorator):
+    """
+    Store a Decimal money amount as integer cents in a BigInteger column.
+    
+    Application code keeps reading and writing Decimal amounts; the
+    database compares and indexes fixed-width integers.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return int(value.scaleb(2).to_integral_value(ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # AVG() yields fractional cents; round to whole cents
+        return Decimal(round(value)).scaleb(-2)
+
+
+DepartmentType = EnumOrdinal(Department)
+EmploymentStatusType = EnumOrdinal(EmploymentStatus)
+
+_INACTIVE_STATUS = text(
+    f"status <> {EmploymentStatusType.ordinal(EmploymentStatus.ACTIVE)}"
+)
+
+
+_EMPLOYEE_REPR = "<Employee(id={id}, name='{first_name} {last_name}', dept='{department}')>"
 
 
 class TimestampMixin:
     """Mixin to add timestamp columns to models."""
-    created_at = Column(
+    created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
         server_default=func.now(),
         nullable=False
     )
-    updated_at = Column(
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
         server_default=func.now(),
         onupdate=func.now(),
@@ -46,41 +137,100 @@ class EmployeeTable(Base, TimestampMixin):
     the database schema for employee data.
     """
     __tablename__ = "employees"
+    __table_args__ = (
+        # Composite indexes for the common filter combinations; the trailing
+        # id lets list() filter and walk the keyset cursor from one index
+        Index("ix_emp_dept_status_id", "department", "status", "id"),
+        Index("ix_emp_status_hire", "status", "hire_date"),
+        # Also serves last-name-only lookups; no single-column name indexes
+        Index("ix_emp_lname_fname", "last_name", "first_name"),
+        # Most employees are active; only index the rarer statuses
+        Index(
+            "ix_emp_inactive",
+            "status",
+            postgresql_where=_INACTIVE_STATUS,
+            sqlite_where=_INACTIVE_STATUS,
+            mssql_where=_INACTIVE_STATUS,
+        ),
+        # GIN index for skills containment queries (PostgreSQL only)
+        Index("ix_emp_skills_gin", "skills", postgresql_using="gin")
+        .ddl_if(dialect="postgresql"),
+        # Trigram index for list()'s ILIKE '%term%' search (PostgreSQL only)
+        Index(
+            "ix_emp_search_trgm",
+            "first_name", "last_name", "email", "employee_id",
+            postgresql_using="gin",
+            postgresql_ops={
+                "first_name": "gin_trgm_ops",
+                "last_name": "gin_trgm_ops",
+                "email": "gin_trgm_ops",
+                "employee_id": "gin_trgm_ops",
+            },
+        ).ddl_if(dialect="postgresql"),
+        CheckConstraint(
+            f"department BETWEEN 0 AND {DepartmentType.max_ordinal}",
+            name="ck_emp_department",
+        ),
+        CheckConstraint(
+            f"status BETWEEN 0 AND {EmploymentStatusType.max_ordinal}",
+            name="ck_emp_status",
+        ),
+    )
 
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     # Personal Information
-    first_name = Column(String(50), nullable=False, index=True)
-    last_name = Column(String(50), nullable=False, index=True)
-    email = Column(String(255), nullable=False, unique=True, index=True)
-    phone = Column(String(20), nullable=True)
-    birth_date = Column(Date, nullable=True)
+    first_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    birth_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
 
     # Employment Information
-    employee_id = Column(String(10), nullable=False, unique=True, index=True)
-    department = Column(SQLEnum(Department), nullable=False, index=True)
-    position = Column(String(100), nullable=False)
-    hire_date = Column(Date, nullable=False, index=True)
-    salary = Column(Numeric(10, 2), nullable=False)
-    status = Column(
-        SQLEnum(EmploymentStatus), 
+    employee_id: Mapped[str] = mapped_column(String(10), nullable=False, unique=True, index=True)
+    department: Mapped[Department] = mapped_column(DepartmentType, nullable=False)
+    position: Mapped[str] = mapped_column(String(100), nullable=False)
+    hire_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    salary: Mapped[Decimal] = mapped_column(MoneyCents, nullable=False)
+    status: Mapped[EmploymentStatus] = mapped_column(
+        EmploymentStatusType, 
         nullable=False, 
-        default=EmploymentStatus.ACTIVE,
-        index=True
+        default=EmploymentStatus.ACTIVE
     )
 
     # Manager relationship (self-referential)
-    manager_id = Column(Integer, ForeignKey("employees.id"), nullable=True)
-    manager = relationship("EmployeeTable", remote_side=[id], backref="direct_reports")
+    manager_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("employees.id"), nullable=True
+    )
+    # Raise instead of lazy loading so N+1 traversals fail loudly; load
+    # these explicitly with selectinload() (see list_employees)
+    manager: Mapped[Optional["EmployeeTable"]] = relationship(
+        "EmployeeTable",
+        remote_side=[id],
+        backref=backref("direct_reports", lazy="raise_on_sql"),
+        lazy="raise_on_sql"
+    )
 
-    # Additional data stored as JSON
-    skills = Column(JSON, nullable=True, default=list)
-    additional_metadata = Column(JSON, nullable=True, default=dict)
+    # Additional data stored as JSON; deferred so wide scans skip decoding it.
+    # Load with undefer_group(JSON_GROUP) when the values are needed.
+    skills: Mapped[Optional[List[str]]] = mapped_column(
+        JSONType, nullable=True, default=list, deferred=True, deferred_group=JSON_GROUP
+    )
+    additional_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONType, nullable=True, default=dict, deferred=True, deferred_group=JSON_GROUP
+    )
 
     def __repr__(self) -> str:
         """String representation of Employee."""
-        return f"<Employee(id={self.id}, name='{self.first_name} {self.last_name}', dept='{self.department}')>"
+        # Attributes are read explicitly rather than via format_map(self.__dict__):
+        # expired or deferred attributes are missing from __dict__ until loaded
+        return _EMPLOYEE_REPR.format(
+            id=self.id,
+            first_name=self.first_name,
+            last_name=self.last_name,
+            department=self.department,
+        )
 
     @property
     def full_name(self) -> str:
@@ -105,12 +255,61 @@ class EmployeeTable(Base, TimestampMixin):
             (today.month, today.day) < (self.birth_date.month, self.birth_date.day)
         )
 
+    @classmethod
+    def compute_tenures(cls, employees: List["EmployeeTable"]) -> List[float]:
+        """Calculate years of service for many employees against one today."""
+        today = date.today()
+        return [round((today - emp.hire_date).days / 365.25, 1) for emp in employees]
+
+    @classmethod
+    def compute_ages(cls, employees: List["EmployeeTable"]) -> List[Optional[int]]:
+        """Calculate ages for many employees against one today."""
+        today = date.today()
+        today_key = (today.month, today.day)
+        return [
+            None if emp.birth_date is None
+            else today.year - emp.birth_date.year - (
+                today_key < (emp.birth_date.month, emp.birth_date.day)
+            )
+            for emp in employees
+        ]
+
+
+# gin_trgm_ops comes from the pg_trgm extension
+event.listen(
+    EmployeeTable.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+def _lower_pattern_index(column) -> Index:
+    """PostgreSQL btree on lower(column) that serves LIKE 'prefix%' range scans."""
+    label = f"{column.key}_lower"
+    return Index(
+        f"ix_emp_{label}_pattern",
+        func.lower(column).label(label),
+        postgresql_ops={label: "text_pattern_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
+# Prefix-search indexes for list(search_prefix_only=True)
+_lower_pattern_index(EmployeeTable.first_name)
+_lower_pattern_index(EmployeeTable.last_name)
+_lower_pattern_index(EmployeeTable.email)
+_lower_pattern_index(EmployeeTable.employee_id)
+
+# Core INSERT shared by every bulk employee insert (insert_employee_rows and
+# the legacy upgrade); its compiled form is reused from the statement cache
+_EMPLOYEE_INSERT = insert(EmployeeTable.__table__)
+
 
 
 
 # Database utility functions
 def create_tables(engine):
     """Create all database tables."""
+    upgrade_legacy_employees(engine)
     Base.metadata.create_all(bind=engine)
 
 
@@ -119,6 +318,98 @@ def drop_tables(engine):
     Base.metadata.drop_all(bind=engine)
 
 
+def _legacy_member(enum_class, value):
+    """Enum member for a stored name (legacy rows) or ordinal (current rows)."""
+    if isinstance(value, int):
+        return tuple(enum_class)[value]
+    return enum_class[value]
+
+
+def _is_legacy_employees(column_types: Dict[str, Any]) -> bool:
+    """Whether a reflected employees table predates the ordinal or cents columns."""
+    return any(
+        not isinstance(column_types[name], Integer)
+        for name in ("department", "status", "salary")
+    )
+
+
+def upgrade_legacy_employees(engine) -> int:
+    """
+    Rebuild an employees table created before the current column types.
+    
+    Older databases store department and status as enum-name strings,
+    which the ordinal columns cannot read, and salary as decimal dollars,
+    which the cents column would read 100 times too small. The old rows
+    are read back (salary as dollars, re-bound as cents on insert),
+    the table is recreated with the current schema and the rows are
+    copied in, so the upgrade runs once per database.
+    
+    Args:
+        engine: SQLAlchemy engine
+        
+    Returns:
+        Number of rows migrated (0 when no upgrade was needed)
+    """
+    table = EmployeeTable.__table__
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        if not inspector.has_table(table.name):
+            return 0
+        column_types = {
+            column["name"]: column["type"] for column in inspector.get_columns(table.name)
+        }
+        if not _is_legacy_employees(column_types):
+            return 0
+        
+        legacy = Table(table.name, MetaData(), autoload_with=conn)
+        rows = [dict(row) for row in conn.execute(select(legacy)).mappings()]
+        legacy.drop(conn)
+        # PostgreSQL keeps the old native enum types after their table is gone
+        for name in ("department", "status"):
+            if isinstance(column_types[name], ENUM):
+                column_types[name].drop(conn, checkfirst=True)
+        table.create(conn)
+        if not rows:
+            return 0
+        
+        # Managers may have higher ids than their reports; link them afterwards
+        managers = [
+            {"b_id": row["id"], "b_manager_id": row["manager_id"]}
+            for row in rows if row["manager_id"] is not None
+        ]
+        for row in rows:
+            row["department"] = _legacy_member(Department, row["department"])
+            row["status"] = _legacy_member(EmploymentStatus, row["status"])
+            row["manager_id"] = None
+        conn.execute(_EMPLOYEE_INSERT, rows)
+        if managers:
+            conn.execute(
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values(manager_id=bindparam("b_manager_id")),
+                managers
+            )
+        if conn.dialect.name == "postgresql":
+            # Rows were copied with explicit ids; move the SERIAL sequence past them
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), max(id)) "
+                f"FROM {table.name}"
+            ))
+    return len(rows)
+
+
+@lru_cache(maxsize=1)
+def _static_table_info() -> dict:
+    """Column and foreign key names per table; fixed once models load."""
+    return {
+        table_name: {
+            'columns': [col.name for col in table.columns],
+            'foreign_keys': [fk.column.key for fk in table.foreign_keys]
+        }
+        for table_name, table in Base.metadata.tables.items()
+    }
+
+
 def get_table_info(session: Session) -> dict:
     """
     Get information about all database tables.
@@ -129,26 +420,54 @@ def get_table_info(session: Session) -> dict:
     Returns:
         Dictionary with table information
     """
-    tables = {}
+    tables = Base.metadata.tables
     
-    for table_name, table in Base.metadata.tables.items():
-        # Get row count
-        try:
-            count = session.query(
-                getattr(globals()[f"{table_name.title().rstrip('s')}Table"], 'id')
-            ).count()
-        except (KeyError, AttributeError):
-            # Handle tables that don't follow naming convention
-            count = 0
-        
-        tables[table_name] = {
-            'columns': [col.name for col in table.columns],
-            'row_count': count,
-            'indexes': [idx.name for idx in table.indexes],
-            'foreign_keys': [fk.column.key for fk in table.foreign_keys]
+    if len(tables) == 1:
+        # A single table needs no UNION; count it directly
+        (table_name, table), = tables.items()
+        row_counts = {
+            table_name: session.execute(select(func.count()).select_from(table)).scalar()
+        }
+    else:
+        # Count rows in every table with a single round trip
+        count_query = union_all(*[
+            select(literal(table_name).label("table_name"), func.count().label("row_count"))
+            .select_from(table)
+            for table_name, table in tables.items()
+        ])
+        row_counts = dict(session.execute(count_query).all())
+    
+    # Indexes vary by dialect (some are PostgreSQL-only), so read the real ones
+    inspector = inspect(session.connection())
+    return {
+        table_name: {
+            'columns': static_info['columns'],
+            'indexes': [idx['name'] for idx in inspector.get_indexes(table_name)],
+            'foreign_keys': static_info['foreign_keys'],
+            'row_count': row_counts.get(table_name, 0)
         }
+        for table_name, static_info in _static_table_info().items()
+    }
+
+
+def list_employees(session: Session) -> List[EmployeeTable]:
+    """
+    Load all employees with their manager and direct reports.
+    
+    Relationships are fetched with one extra SELECT each rather than
+    one query per employee.
     
-    return tables
+    Args:
+        session: SQLAlchemy session
+        
+    Returns:
+        List of employees with relationships loaded
+    """
+    query = select(EmployeeTable).options(
+        selectinload(EmployeeTable.manager),
+        selectinload(EmployeeTable.direct_reports),
+    )
+    return list(session.scalars(query))
 
 
 def create_sample_employee(session: Session) -> EmployeeTable:
@@ -174,3 +493,25 @@ def create_sample_employee(session: Session) -> EmployeeTable:
     session.refresh(employee)
     return employee
 
+
+def insert_employee_rows(session: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Bulk insert employees from a list of column dictionaries.
+    
+    Rows are sent through a prebuilt Core INSERT as executemany batches of
+    up to BATCH_SIZE rows, inside the caller's transaction. This skips ORM
+    instance construction and state tracking entirely.
+    
+    Args:
+        session: SQLAlchemy session
+        rows: Employee column values, one dictionary per row
+        
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+    
+    for start in range(0, len(rows), BATCH_SIZE):
+        session.connection().execute(_EMPLOYEE_INSERT, rows[start:start + BATCH_SIZE])
+    return len(rows)
@@ -5,18 +5,155 @@ This module implements the repository pattern for database operations,
 providing a clean interface between our Pydantic models and SQLAlchemy models.
 """
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, undefer_group
+from sqlalchemy import event, exists, func, and_, or_, bindparam, insert, select, type_coerce
 from decimal import Decimal
 
-from .models import EmployeeTable
+from .models import EmployeeTable, JSON_GROUP, MoneyCents
 from ..models.employee import (
     Employee, EmployeeCreate, EmployeeUpdate, 
     Department, EmploymentStatus
 )
 
 
+# Lookup statements built once so every call hits the compiled-statement cache
+_SELECT_EMPLOYEE_DETAILS = select(EmployeeTable).options(undefer_group(JSON_GROUP))
+_GET_EMPLOYEE_BY_ID = _SELECT_EMPLOYEE_DETAILS.where(
+    EmployeeTable.id == bindparam("id")
+)
+_GET_EMPLOYEE_BY_EMPLOYEE_ID = _SELECT_EMPLOYEE_DETAILS.where(
+    EmployeeTable.employee_id == bindparam("employee_id")
+)
+_GET_EMPLOYEE_BY_EMAIL = _SELECT_EMPLOYEE_DETAILS.where(
+    EmployeeTable.email == bindparam("email")
+)
+
+# Columns backing the Employee model, for read-only projections
+_EMPLOYEE_COLUMNS = (
+    EmployeeTable.id,
+    EmployeeTable.first_name,
+    EmployeeTable.last_name,
+    EmployeeTable.email,
+    EmployeeTable.phone,
+    EmployeeTable.birth_date,
+    EmployeeTable.employee_id,
+    EmployeeTable.department,
+    EmployeeTable.position,
+    EmployeeTable.hire_date,
+    EmployeeTable.salary,
+    EmployeeTable.status,
+    EmployeeTable.manager_id,
+    EmployeeTable.skills,
+    EmployeeTable.additional_metadata,
+    EmployeeTable.created_at,
+    EmployeeTable.updated_at,
+)
+
+# Columns matched by list()'s search term
+_SEARCH_COLUMNS = (
+    EmployeeTable.first_name,
+    EmployeeTable.last_name,
+    EmployeeTable.email,
+    EmployeeTable.employee_id,
+)
+
+# Validates a whole page of rows in one call instead of one call per row
+_EMPLOYEE_LIST_ADAPTER = TypeAdapter(List[Employee])
+
+
+class _LookupCache:
+    """
+    Small thread-safe LRU cache with per-entry TTL for repository reads.
+    
+    Values are deep-copied on the way in and out so callers can never
+    mutate a cached entry.
+    """
+    
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        """Return a copy of the cached value, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+    
+    def set(self, key: str, value: Any) -> None:
+        """Cache a copy of a value under the given key."""
+        entry = (time.monotonic() + self.ttl, copy.deepcopy(value))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def discard(self, *keys: str) -> None:
+        """Drop the given keys if present."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by all repositories; keys are scoped by database URL
+_lookup_cache = _LookupCache()
+# Aggregates change slowly; committed writes through the repository clear them
+_stats_cache = _LookupCache(ttl=30.0, maxsize=64)
+
+# Session.info key: lookup cache keys to drop once the session's writes commit.
+# Its presence also marks the session as holding uncommitted repository writes.
+_PENDING_INVALIDATIONS = "employee_cache_invalidations"
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_cache_invalidations(session: Session) -> None:
+    """Drop cached lookups and stats made stale by writes this session just committed."""
+    keys = session.info.pop(_PENDING_INVALIDATIONS, None)
+    if keys is not None:
+        _lookup_cache.discard(*keys)
+        _stats_cache.clear()
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_cache_invalidations(session: Session, transaction) -> None:
+    """Rolled-back (or abandoned) writes never reached the database."""
+    if transaction.parent is None:
+        session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+# Aggregate statements for the dashboard statistics
+_DEPARTMENT_COUNTS = select(
+    EmployeeTable.department, func.count()
+).group_by(EmployeeTable.department)
+_SALARY_STATS = select(
+    # AVG() has no inherent type; decode it from cents like the column
+    type_coerce(func.avg(EmployeeTable.salary), MoneyCents),
+    func.min(EmployeeTable.salary),
+    func.max(EmployeeTable.salary),
+    func.count()
+)
+
+
 class BaseRepository:
     """
     Base repository class with common database operations.
@@ -44,8 +181,43 @@ class EmployeeRepository(BaseRepository):
     Repository for employee database operations.
     
     Provides CRUD operations and business logic for employee data.
+    Writes are flushed, not committed; the caller owns the transaction.
     """
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached reads (e.g. after bulk writes outside the repository)."""
+        _lookup_cache.clear()
+        _stats_cache.clear()
+    
+    def _cache_key(self, field: str, value: str) -> str:
+        """Build a lookup cache key scoped to this session's database."""
+        return f"{self.session.get_bind().url}:emp:{field}:{value}"
+    
+    def _record_write(self, *cache_keys: str) -> None:
+        """Note an uncommitted write; the given keys are dropped on commit."""
+        self.session.info.setdefault(_PENDING_INVALIDATIONS, set()).update(cache_keys)
+    
+    def _can_use_cache(self) -> bool:
+        """
+        Whether lookups and stats may read and fill the caches.
+        
+        A session with uncommitted writes may see rows other sessions cannot
+        (or that a rollback will discard), so it bypasses the cache entirely.
+        """
+        return _PENDING_INVALIDATIONS not in self.session.info
+    
+    def _invalidate_cached(self, db_employee: EmployeeTable) -> None:
+        """Drop cached lookups for an employee's current keys, and all stats, on commit."""
+        self._record_write(
+            self._cache_key("employee_id", db_employee.employee_id),
+            self._cache_key("email", db_employee.email)
+        )
+    
+    def _query_with_details(self):
+        """Query employees with the deferred JSON columns loaded up front."""
+        return self.session.query(EmployeeTable).options(undefer_group(JSON_GROUP))
+    
     def _generate_employee_id(self) -> str:
         """Generate a unique employee ID."""
         # Get the highest existing employee ID
@@ -81,24 +253,36 @@ class EmployeeRepository(BaseRepository):
         if not employee_data.employee_id:
             employee_data.employee_id = self._generate_employee_id()
         
-        # Check for duplicates
-        existing_employee_id = self.session.query(EmployeeTable).filter(
-            EmployeeTable.employee_id == employee_data.employee_id
-        ).first()
-        if existing_employee_id:
+        # Check for duplicates in one query
+        existing = self.session.query(
+            EmployeeTable.employee_id, EmployeeTable.email
+        ).filter(
+            or_(
+                EmployeeTable.employee_id == employee_data.employee_id,
+                EmployeeTable.email == employee_data.email
+            )
+        ).all()
+        if any(row.employee_id == employee_data.employee_id for row in existing):
             raise ValueError(f"Employee ID {employee_data.employee_id} already exists")
-        
-        existing_email = self.session.query(EmployeeTable).filter(
-            EmployeeTable.email == employee_data.email
-        ).first()
-        if existing_email:
+        if existing:
             raise ValueError(f"Email {employee_data.email} already exists")
         
+        payload = employee_data.model_dump(exclude={'id', 'created_at', 'updated_at'})
+        self._record_write()
+        
+        if self.session.get_bind().dialect.insert_returning:
+            # INSERT ... RETURNING hands back the stored row, server defaults
+            # included, without a follow-up SELECT
+            row = self.session.execute(
+                insert(EmployeeTable).values(**payload).returning(*_EMPLOYEE_COLUMNS)
+            ).mappings().one()
+            return Employee.model_validate(row)
+        
         # Create SQLAlchemy model from Pydantic model
-        db_employee = EmployeeTable(**employee_data.model_dump(exclude={'id', 'created_at', 'updated_at'}))
+        db_employee = EmployeeTable(**payload)
         
         self.session.add(db_employee)
-        self.session.commit()
+        self.session.flush()
         self.session.refresh(db_employee)
         
         # Convert back to Pydantic model
@@ -114,9 +298,9 @@ class EmployeeRepository(BaseRepository):
         Returns:
             Employee if found, None otherwise
         """
-        db_employee = self.session.query(EmployeeTable).filter(
-            EmployeeTable.id == employee_id
-        ).first()
+        db_employee = self.session.execute(
+            _GET_EMPLOYEE_BY_ID, {"id": employee_id}
+        ).scalar_one_or_none()
         
         return self._to_pydantic(db_employee) if db_employee else None
     
@@ -130,11 +314,22 @@ class EmployeeRepository(BaseRepository):
         Returns:
             Employee if found, None otherwise
         """
-        db_employee = self.session.query(EmployeeTable).filter(
-            EmployeeTable.employee_id == employee_id
-        ).first()
+        use_cache = self._can_use_cache()
+        cache_key = self._cache_key("employee_id", employee_id)
+        cached = _lookup_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            return cached
+        
+        db_employee = self.session.execute(
+            _GET_EMPLOYEE_BY_EMPLOYEE_ID, {"employee_id": employee_id}
+        ).scalar_one_or_none()
+        if not db_employee:
+            return None
         
-        return self._to_pydantic(db_employee) if db_employee else None
+        employee = self._to_pydantic(db_employee)
+        if use_cache:
+            _lookup_cache.set(cache_key, employee)
+        return employee
     
     def get_by_email(self, email: str) -> Optional[Employee]:
         """
@@ -146,11 +341,22 @@ class EmployeeRepository(BaseRepository):
         Returns:
             Employee if found, None otherwise
         """
-        db_employee = self.session.query(EmployeeTable).filter(
-            EmployeeTable.email == email
-        ).first()
+        use_cache = self._can_use_cache()
+        cache_key = self._cache_key("email", email)
+        cached = _lookup_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            return cached
+        
+        db_employee = self.session.execute(
+            _GET_EMPLOYEE_BY_EMAIL, {"email": email}
+        ).scalar_one_or_none()
+        if not db_employee:
+            return None
         
-        return self._to_pydantic(db_employee) if db_employee else None
+        employee = self._to_pydantic(db_employee)
+        if use_cache:
+            _lookup_cache.set(cache_key, employee)
+        return employee
     
     def update(self, employee_id: int, employee_data: EmployeeUpdate) -> Optional[Employee]:
         """
@@ -163,19 +369,22 @@ class EmployeeRepository(BaseRepository):
         Returns:
             Updated employee if found, None otherwise
         """
-        db_employee = self.session.query(EmployeeTable).filter(
-            EmployeeTable.id == employee_id
-        ).first()
+        db_employee = self.session.execute(
+            _GET_EMPLOYEE_BY_ID, {"id": employee_id}
+        ).scalar_one_or_none()
         
         if not db_employee:
             return None
         
+        # Keys may change below, so drop entries under the current ones
+        self._invalidate_cached(db_employee)
+        
         # Update only provided fields
         update_data = employee_data.model_dump(exclude_unset=True, exclude={'id', 'created_at', 'updated_at'})
         for field, value in update_data.items():
             setattr(db_employee, field, value)
         
-        self.session.commit()
+        self.session.flush()
         self.session.refresh(db_employee)
         
         return self._to_pydantic(db_employee)
@@ -197,8 +406,9 @@ class EmployeeRepository(BaseRepository):
         if not db_employee:
             return False
         
+        self._invalidate_cached(db_employee)
         self.session.delete(db_employee)
-        self.session.commit()
+        self.session.flush()
         return True
     
     def list(
@@ -207,54 +417,87 @@ class EmployeeRepository(BaseRepository):
         limit: int = 100,
         department: Optional[Department] = None,
         status: Optional[EmploymentStatus] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search_prefix_only: bool = False
     ) -> Dict[str, Any]:
         """
         List employees with filtering and pagination.
         
+        Results are ordered by ID. Pass the previous page's ``next_cursor``
+        as ``after_id`` to seek straight to the next page through the
+        primary key instead of scanning and discarding ``skip`` rows.
+        
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after_id is given)
             limit: Maximum number of records to return
             department: Filter by department
             status: Filter by employment status
             search: Search term for name or email
+            after_id: Return only employees with an ID greater than this cursor
+            search_prefix_only: Match the search term only at the start of each
+                column, which can use the lower() prefix indexes
             
         Returns:
             Dictionary with employees and pagination info
         """
-        query = self.session.query(EmployeeTable)
-        
-        # Apply filters
+        # Build filters once; they are shared by the count and the page query
+        filters = []
         if department:
-            query = query.filter(EmployeeTable.department == department)
+            filters.append(EmployeeTable.department == department)
         
         if status:
-            query = query.filter(EmployeeTable.status == status)
+            filters.append(EmployeeTable.status == status)
         
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    EmployeeTable.first_name.ilike(search_term),
-                    EmployeeTable.last_name.ilike(search_term),
-                    EmployeeTable.email.ilike(search_term),
-                    EmployeeTable.employee_id.ilike(search_term)
+            if search_prefix_only:
+                # lower(col) LIKE 'term%' matches the ix_emp_*_lower_pattern indexes
+                search_term = f"{search.lower()}%"
+                filters.append(
+                    or_(*(func.lower(column).like(search_term) for column in _SEARCH_COLUMNS))
+                )
+            else:
+                search_term = f"%{search}%"
+                filters.append(
+                    or_(*(column.ilike(search_term) for column in _SEARCH_COLUMNS))
                 )
-            )
         
-        # Get total count
-        total_count = query.count()
+        # Get total count with a bare COUNT rather than a wrapped subquery
+        count_query = select(func.count()).select_from(EmployeeTable).where(*filters)
+        total_count = self.session.execute(count_query).scalar()
+        
+        # Select plain columns; the page is validated as rows, not ORM instances
+        query = (
+            select(*_EMPLOYEE_COLUMNS)
+            .where(*filters)
+            .order_by(EmployeeTable.id)
+        )
         
         # Apply pagination
-        employees = query.offset(skip).limit(limit).all()
+        if after_id is not None:
+            # Keyset pagination: fetch one extra row to detect a next page
+            query = query.where(EmployeeTable.id > after_id).limit(limit + 1)
+        else:
+            query = query.offset(skip).limit(limit)
         
         # Convert to Pydantic models
-        pydantic_employees = [self._to_pydantic(emp) for emp in employees]
+        pydantic_employees = _EMPLOYEE_LIST_ADAPTER.validate_python(
+            self.session.execute(query).mappings().all()
+        )
         
         # Calculate pagination info
-        page = (skip // limit) + 1
-        has_next = (skip + limit) < total_count
-        has_prev = skip > 0
+        if after_id is not None:
+            has_next = len(pydantic_employees) > limit
+            pydantic_employees = pydantic_employees[:limit]
+            page = None
+            # A previous page exists if any matching row sits at or before the cursor
+            has_prev = self.session.execute(
+                select(exists().where(*filters, EmployeeTable.id <= after_id))
+            ).scalar()
+        else:
+            page = (skip // limit) + 1
+            has_next = (skip + limit) < total_count
+            has_prev = skip > 0
         
         return {
             'items': pydantic_employees,
@@ -262,7 +505,8 @@ class EmployeeRepository(BaseRepository):
             'page': page,
             'page_size': limit,
             'has_next': has_next,
-            'has_prev': has_prev
+            'has_prev': has_prev,
+            'next_cursor': pydantic_employees[-1].id if pydantic_employees else None
         }
     
     def get_department_stats(self) -> Dict[str, int]:
@@ -272,12 +516,15 @@ class EmployeeRepository(BaseRepository):
         Returns:
             Dictionary with department counts
         """
-        stats = self.session.query(
-            EmployeeTable.department,
-            func.count(EmployeeTable.id)
-        ).group_by(EmployeeTable.department).all()
-        
-        return {str(dept): count for dept, count in stats}
+        use_cache = self._can_use_cache()
+        cache_key = self._cache_key("stats", "department")
+        stats = _stats_cache.get(cache_key) if use_cache else None
+        if stats is None:
+            rows = self.session.execute(_DEPARTMENT_COUNTS).all()
+            stats = {str(dept): count for dept, count in rows}
+            if use_cache:
+                _stats_cache.set(cache_key, stats)
+        return stats
     
     def get_salary_stats(self) -> Dict[str, float]:
         """
@@ -286,19 +533,20 @@ class EmployeeRepository(BaseRepository):
         Returns:
             Dictionary with salary statistics
         """
-        result = self.session.query(
-            func.avg(EmployeeTable.salary),
-            func.min(EmployeeTable.salary),
-            func.max(EmployeeTable.salary),
-            func.count(EmployeeTable.id)
-        ).first()
-        
-        return {
-            "average": float(result[0] or 0),
-            "minimum": float(result[1] or 0),
-            "maximum": float(result[2] or 0),
-            "count": result[3]
-        }
+        use_cache = self._can_use_cache()
+        cache_key = self._cache_key("stats", "salary")
+        stats = _stats_cache.get(cache_key) if use_cache else None
+        if stats is None:
+            average, minimum, maximum, count = self.session.execute(_SALARY_STATS).one()
+            stats = {
+                "average": float(average or 0),
+                "minimum": float(minimum or 0),
+                "maximum": float(maximum or 0),
+                "count": count
+            }
+            if use_cache:
+                _stats_cache.set(cache_key, stats)
+        return stats
     
     def get_employees_by_manager(self, manager_id: int) -> List[Employee]:
         """
@@ -310,7 +558,7 @@ class EmployeeRepository(BaseRepository):
         Returns:
             List of direct report employees
         """
-        employees = self.session.query(EmployeeTable).filter(
+        employees = self._query_with_details().filter(
             EmployeeTable.manager_id == manager_id
         ).all()
         
@@ -329,7 +577,7 @@ class EmployeeRepository(BaseRepository):
         if not employees:
             return 0.0
         
-        total_years = sum(emp.years_of_service for emp in employees)
+        total_years = sum(EmployeeTable.compute_tenures(employees))
         return round(total_years / len(employees), 1)
     
     def get_employees_with_managers_count(self) -> int:
@@ -365,34 +613,5 @@ class EmployeeRepository(BaseRepository):
     
     def _to_pydantic(self, db_employee: EmployeeTable) -> Employee:
         """Convert SQLAlchemy model to Pydantic model."""
-        from ..models.employee import Department, EmploymentStatus
-        
-        # Ensure enum values are properly converted
-        department = db_employee.department
-        if isinstance(department, str):
-            department = Department(department)
-        
-        status = db_employee.status
-        if isinstance(status, str):
-            status = EmploymentStatus(status)
-        
-        return Employee(
-            id=db_employee.id,
-            first_name=db_employee.first_name,
-            last_name=db_employee.last_name,
-            email=db_employee.email,
-            phone=db_employee.phone,
-            birth_date=db_employee.birth_date,
-            employee_id=db_employee.employee_id,
-            department=department,
-            position=db_employee.position,
-            hire_date=db_employee.hire_date,
-            salary=db_employee.salary,
-            status=status,
-            manager_id=db_employee.manager_id,
-            skills=db_employee.skills or [],
-            additional_metadata=db_employee.additional_metadata or {},
-            created_at=db_employee.created_at,
-            updated_at=db_employee.updated_at
-        )
-
+        # Pydantic reads the ORM attributes directly (from_attributes=True)
+        return Employee.model_validate(db_employee)
@@ -7,115 +7,187 @@ into the database for testing and demonstration purposes.
 
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List
 import random
-from faker import Faker
+from sqlalchemy import select, text, update
 
 from .connection import DatabaseManager
-from .models import EmployeeTable
+from .models import EmployeeTable, insert_employee_rows
+from .repository import EmployeeRepository
 from ..models.employee import Department, EmploymentStatus
 
-# Initialize Faker for generating realistic sample data
-fake = Faker()
 
+@lru_cache(maxsize=None)
+def _get_faker():
+    """
+    Return the shared Faker instance, creating it on first use.
+    
+    Importing Faker and loading its providers is slow, and callers that
+    only need create_demo_data never touch it.
+    """
+    from faker import Faker
+    return Faker()
+
+
+_DEPARTMENTS = list(Department)
+_STATUSES = list(EmploymentStatus)
+# Cumulative status weights (80/5/10/5): most active, few others
+_STATUS_CUM_WEIGHTS = (80, 85, 95, 100)
+
+# Predefined skills for different departments
+_SKILLS_BY_DEPT = {
+    Department.ENGINEERING: (
+        "Python", "JavaScript", "SQL", "Docker", "Kubernetes", 
+        "React", "Node.js", "AWS", "Machine Learning", "Git"
+    ),
+    Department.MARKETING: (
+        "SEO", "Content Marketing", "Social Media", "Analytics", 
+        "Email Marketing", "Copywriting", "Brand Strategy", "PPC"
+    ),
+    Department.SALES: (
+        "CRM", "Lead Generation", "Negotiation", "Customer Relations",
+        "Sales Strategy", "Presentations", "Territory Management"
+    ),
+    Department.HR: (
+        "Recruitment", "Employee Relations", "Performance Management",
+        "Benefits Administration", "Training", "Compliance"
+    ),
+    Department.FINANCE: (
+        "Financial Analysis", "Budgeting", "Forecasting", "Excel",
+        "SAP", "Accounting", "Risk Management", "Audit"
+    ),
+    Department.OPERATIONS: (
+        "Project Management", "Process Optimization", "Supply Chain",
+        "Quality Management", "Vendor Relations", "Logistics"
+    )
+}
+
+# Departments whose employees are all manager candidates
+_MANAGER_DEPARTMENTS = frozenset({Department.HR, Department.OPERATIONS})
+
+# Choices for the generated additional_metadata
+_PERFORMANCE_RATINGS = ("excellent", "good", "satisfactory", "needs_improvement")
+_REMOTE_ELIGIBLE = (True, False)
+
+# Sample date windows in days: hired within 5 years, aged 22-65
+_HIRE_WINDOW_DAYS = round(5 * 365.25)
+_MIN_AGE_DAYS = round(22 * 365.25)
+_MAX_AGE_DAYS = round(65 * 365.25)
+
+# Allowed skill counts per department (2 up to 6, capped by the list size)
+_SKILL_COUNTS = {
+    dept: range(2, min(6, len(skills)) + 1)
+    for dept, skills in _SKILLS_BY_DEPT.items()
+}
+
+# Base salary for each department, before experience adjustment
+_BASE_SALARY = {
+    Department.ENGINEERING: 75000,
+    Department.MARKETING: 60000,
+    Department.SALES: 65000,
+    Department.HR: 55000,
+    Department.FINANCE: 70000,
+    Department.OPERATIONS: 60000
+}
 
-def create_sample_employees(count: int = 20) -> List[EmployeeTable]:
+
+# Distinct Faker values generated per field; rows draw from these pools
+FAKER_POOL_SIZE = 500
+# Lorem sentences are only used for optional notes, so fewer will do
+NOTES_POOL_SIZE = 20
+
+
+def create_sample_employees(count: int = 20) -> List[Dict[str, Any]]:
     """
     Generate sample employee data.
     
+    Faker is seeded from the random module, so random.seed() reproduces
+    the whole data set.
+    
     Args:
         count: Number of employees to generate
         
     Returns:
-        List of EmployeeTable instances
+        List of employee column mappings, ready for a bulk INSERT
     """
+    fake = _get_faker()
+    fake.seed_instance(random.getrandbits(32))
+    
     employees = []
-    departments = list(Department)
-    statuses = list(EmploymentStatus)
     
-    # Predefined skills for different departments
-    skills_by_dept = {
-        Department.ENGINEERING: [
-            "Python", "JavaScript", "SQL", "Docker", "Kubernetes", 
-            "React", "Node.js", "AWS", "Machine Learning", "Git"
-        ],
-        Department.MARKETING: [
-            "SEO", "Content Marketing", "Social Media", "Analytics", 
-            "Email Marketing", "Copywriting", "Brand Strategy", "PPC"
-        ],
-        Department.SALES: [
-            "CRM", "Lead Generation", "Negotiation", "Customer Relations",
-            "Sales Strategy", "Presentations", "Territory Management"
-        ],
-        Department.HR: [
-            "Recruitment", "Employee Relations", "Performance Management",
-            "Benefits Administration", "Training", "Compliance"
-        ],
-        Department.FINANCE: [
-            "Financial Analysis", "Budgeting", "Forecasting", "Excel",
-            "SAP", "Accounting", "Risk Management", "Audit"
-        ],
-        Department.OPERATIONS: [
-            "Project Management", "Process Optimization", "Supply Chain",
-            "Quality Management", "Vendor Relations", "Logistics"
-        ]
-    }
+    # Faker providers are slow, so build small pools once and draw from them
+    pool_size = min(count, FAKER_POOL_SIZE)
+    first_names = random.choices([fake.first_name() for _ in range(pool_size)], k=count)
+    last_names = random.choices([fake.last_name() for _ in range(pool_size)], k=count)
+    contact_names = random.choices([fake.name() for _ in range(pool_size)], k=count)
+    positions = random.choices([fake.job() for _ in range(pool_size)], k=count)
     
-    for i in range(count):
-        dept = random.choice(departments)
-        status = random.choices(
-            statuses,
-            weights=[80, 5, 10, 5],  # Most active, few others
-            k=1
-        )[0]
-        
-        # Generate hire date (last 5 years)
-        hire_date = fake.date_between(start_date='-5y', end_date='today')
-        
-        # Generate birth date (ages 22-65)
-        birth_date = fake.date_between(start_date='-65y', end_date='-22y')
+    # Draw department, status and salary jitter for all employees up front
+    dept_draws = random.choices(_DEPARTMENTS, k=count)
+    status_draws = random.choices(_STATUSES, cum_weights=_STATUS_CUM_WEIGHTS, k=count)
+    salary_jitters = [random.uniform(-0.2, 0.3) for _ in range(count)]
+    
+    # Draw hire and birth dates as day offsets back from today
+    today = date.today().toordinal()
+    hire_offsets = [random.randint(0, _HIRE_WINDOW_DAYS) for _ in range(count)]
+    birth_offsets = [random.randint(_MIN_AGE_DAYS, _MAX_AGE_DAYS) for _ in range(count)]
+    
+    # Draw the metadata choices in batches too
+    ratings = random.choices(_PERFORMANCE_RATINGS, k=count)
+    remote_flags = random.choices(_REMOTE_ELIGIBLE, k=count)
+    has_notes = [random.random() < 0.3 for _ in range(count)]
+    notes = random.choices([fake.sentence() for _ in range(NOTES_POOL_SIZE)], k=count)
+    
+    employee_ids = [f"EMP{number:03d}" for number in range(1, count + 1)]
+    
+    draws = zip(dept_draws, status_draws, salary_jitters, hire_offsets, birth_offsets)
+    for i, (dept, status, jitter, hire_offset, birth_offset) in enumerate(draws):
+        # Hire date within the last 5 years, birth date for ages 22-65
+        hire_date = date.fromordinal(today - hire_offset)
+        birth_date = date.fromordinal(today - birth_offset)
         
         # Generate salary based on department and experience
-        base_salary = {
-            Department.ENGINEERING: 75000,
-            Department.MARKETING: 60000,
-            Department.SALES: 65000,
-            Department.HR: 55000,
-            Department.FINANCE: 70000,
-            Department.OPERATIONS: 60000
-        }[dept]
+        base_salary = _BASE_SALARY[dept]
         
         # Adjust salary based on experience (years since hire)
-        years_exp = (date.today() - hire_date).days / 365.25
-        salary_multiplier = 1 + (years_exp * 0.05) + random.uniform(-0.2, 0.3)
-        salary = Decimal(str(round(base_salary * salary_multiplier, 2)))
+        years_exp = hire_offset / 365.25
+        salary_multiplier = 1 + (years_exp * 0.05) + jitter
+        salary = Decimal(round(base_salary * salary_multiplier * 100)).scaleb(-2)
         
         # Select random skills from department
-        dept_skills = skills_by_dept[dept]
-        num_skills = random.randint(2, min(6, len(dept_skills)))
-        skills = random.sample(dept_skills, num_skills)
+        num_skills = random.choice(_SKILL_COUNTS[dept])
+        skills = random.sample(_SKILLS_BY_DEPT[dept], num_skills)
         
-        employee = EmployeeTable(
-            first_name=fake.first_name(),
-            last_name=fake.last_name(),
-            email=fake.unique.email(),
-            phone=fake.phone_number(),
-            birth_date=birth_date,
-            employee_id=f"EMP{i+1:03d}",
-            department=dept,
-            position=fake.job(),
-            hire_date=hire_date,
-            salary=salary,
-            status=status,
-            skills=skills,
-            additional_metadata={
-                "performance_rating": random.choice(["excellent", "good", "satisfactory", "needs_improvement"]),
-                "remote_eligible": random.choice([True, False]),
-                "emergency_contact": fake.name(),
-                "notes": fake.sentence() if random.random() < 0.3 else ""
-            }
+        # The employee number keeps emails unique without fake.unique's retries
+        number = i + 1
+        first_name, last_name = first_names[i], last_names[i]
+        local_part = ".".join(
+            "".join(filter(str.isalnum, name.lower())) for name in (first_name, last_name)
         )
         
+        employee = {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": f"{local_part}{number}@example.com",
+            # Reserved 555 numbers, unique per employee
+            "phone": f"+1-555-{number % 10_000_000:07d}",
+            "birth_date": birth_date,
+            "employee_id": employee_ids[i],
+            "department": dept,
+            "position": positions[i],
+            "hire_date": hire_date,
+            "salary": salary,
+            "status": status,
+            "skills": skills,
+            "additional_metadata": {
+                "performance_rating": ratings[i],
+                "remote_eligible": remote_flags[i],
+                "emergency_contact": contact_names[i],
+                "notes": notes[i] if has_notes[i] else ""
+            }
+        }
+        
         employees.append(employee)
     
     return employees
@@ -123,36 +195,64 @@ def create_sample_employees(count: int = 20) -> List[EmployeeTable]:
 
 
 
-def assign_managers(employees: List[EmployeeTable], session) -> None:
+@lru_cache(maxsize=None)
+def _is_manager_title(position: str) -> bool:
+    """Whether a job title marks a manager candidate (cached: titles repeat)."""
+    title = position.lower()
+    return "manager" in title or "senior" in title
+
+
+def assign_managers(employees: List[Dict[str, Any]], session) -> None:
     """
     Assign managers to employees randomly.
     
     Args:
-        employees: List of employees to assign managers to
-        session: Database session for querying
+        employees: List of inserted employee mappings (with ``id``) to assign managers to
+        session: Database session for writing the assignments
     """
     # Get potential managers (employees who could be managers)
     potential_managers = [
         emp for emp in employees 
-        if "manager" in emp.position.lower() or "senior" in emp.position.lower()
-        or emp.department in [Department.HR, Department.OPERATIONS]
+        if emp["department"] in _MANAGER_DEPARTMENTS or _is_manager_title(emp["position"])
     ]
     
     if not potential_managers:
         potential_managers = random.sample(employees, min(5, len(employees)))
     
+    # Position of each candidate, so self-assignment is skipped without
+    # rebuilding the candidate list for every employee
+    manager_count = len(potential_managers)
+    positions = {m["id"]: pos for pos, m in enumerate(potential_managers)}
+    
+    assignments = []
     for employee in employees:
-        # Don't assign manager to themselves
-        available_managers = [m for m in potential_managers if m.id != employee.id]
+        if random.random() >= 0.7:  # 70% chance of having a manager
+            continue
+        
+        # Don't assign manager to themselves: draw from the other candidates
+        own = positions.get(employee["id"])
+        if own is None:
+            pick = random.randrange(manager_count)
+        elif manager_count > 1:
+            pick = random.randrange(manager_count - 1)
+            if pick >= own:
+                pick += 1
+        else:
+            continue
         
-        if available_managers and random.random() < 0.7:  # 70% chance of having a manager
-            manager = random.choice(available_managers)
-            employee.manager_id = manager.id
+        manager = potential_managers[pick]
+        employee["manager_id"] = manager["id"]
+        assignments.append({"id": employee["id"], "manager_id": manager["id"]})
+    
+    # Write all assignments as one executemany UPDATE keyed on primary key
+    if assignments:
+        session.execute(update(EmployeeTable), assignments)
 
 
 def insert_sample_data(db_manager: DatabaseManager, 
                       employee_count: int = 50, 
-                      user_count: int = 0) -> dict:
+                      user_count: int = 0,
+                      clear_existing: bool = True) -> dict:
     """
     Insert sample data into the database.
     
@@ -160,34 +260,42 @@ def insert_sample_data(db_manager: DatabaseManager,
         db_manager: Database manager instance
         employee_count: Number of sample employees to create
         user_count: Number of sample users to create (ignored, kept for compatibility)
+        clear_existing: Remove existing employees first (skip for freshly created tables)
         
     Returns:
         Dictionary with insertion results
     """
+    employees = create_sample_employees(employee_count)
+    
+    # One transaction for the whole reload; session_scope commits once on exit
     with db_manager.session_scope() as session:
         # Clear existing data
-        session.query(EmployeeTable).delete()
-        session.commit()
+        if clear_existing:
+            if session.get_bind().dialect.name == "postgresql":
+                session.execute(text(f"TRUNCATE TABLE {EmployeeTable.__tablename__} RESTART IDENTITY CASCADE"))
+            else:
+                session.query(EmployeeTable).delete()
         
-        # Generate and insert employees
-        employees = create_sample_employees(employee_count)
-        session.add_all(employees)
-        session.commit()
+        # Insert employees as executemany batches (nothing to send when empty)
+        insert_employee_rows(session, employees)
         
-        # Refresh employees to get their IDs
+        # Fetch all generated IDs in one query
+        id_map = dict(session.execute(select(EmployeeTable.employee_id, EmployeeTable.id)).all())
         for emp in employees:
-            session.refresh(emp)
+            emp["id"] = id_map[emp["employee_id"]]
         
         # Assign managers
         assign_managers(employees, session)
-        session.commit()
-        
-        return {
-            "employees_created": len(employees),
-            "users_created": 0,
-            "employees_with_managers": sum(1 for emp in employees if emp.manager_id),
-            "departments_represented": len(set(emp.department for emp in employees))
-        }
+    
+    # Cached lookups and stats no longer reflect the table
+    EmployeeRepository.clear_cache()
+    
+    return {
+        "employees_created": len(employees),
+        "users_created": 0,
+        "employees_with_managers": sum(1 for emp in employees if emp.get("manager_id")),
+        "departments_represented": len(set(emp["department"] for emp in employees))
+    }
 
 
 def create_demo_data() -> dict:
@@ -248,13 +356,8 @@ def create_demo_data() -> dict:
     db_manager = get_database_manager()
     
     with db_manager.session_scope() as session:
-        # Insert demo employees
-        for emp_data in demo_employees:
-            employee = EmployeeTable(**emp_data)
-            session.add(employee)
-        
-        
-        session.commit()
+        insert_employee_rows(session, demo_employees)
+    EmployeeRepository.clear_cache()
     
     return {
         "demo_employees_created": len(demo_employees),
@@ -280,8 +383,8 @@ def reset_with_sample_data(employee_count: int = 20, user_count: int = 0) -> dic
     # Recreate tables
     db_manager.recreate_tables()
     
-    # Insert sample data
-    result = insert_sample_data(db_manager, employee_count, user_count)
+    # Insert sample data (tables are empty, nothing to clear)
+    result = insert_sample_data(db_manager, employee_count, user_count, clear_existing=False)
     result["database_reset"] = True
     
     return result
\ No newline at end of file
@@ -10,11 +10,13 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional, List, Dict, Any
 from pydantic import (
+    ConfigDict,
     Field, 
     EmailStr, 
     field_validator, 
     computed_field,
-    model_validator
+    model_validator,
+    ValidationInfo
 )
 
 from .base import DatabaseModel
@@ -38,12 +40,33 @@ class EmploymentStatus(str, Enum):
     ON_LEAVE = "on_leave"
 
 
+def _unique_skills(skills: List[str]) -> List[str]:
+    """Strip skills and drop blanks and case-insensitive duplicates, keeping order."""
+    stripped = [skill.strip() for skill in skills]
+    keys = {skill.lower() for skill in stripped}
+    
+    # Fast path: nothing blank and nothing repeated, which is the usual case
+    if len(keys) == len(stripped) and "" not in keys:
+        return stripped
+    
+    # Remove duplicates while preserving order; setdefault keeps the first casing
+    unique_skills: Dict[str, str] = {}
+    for skill in stripped:
+        if skill:
+            unique_skills.setdefault(skill.lower(), skill)
+    
+    return list(unique_skills.values())
+
+
 class Employee(DatabaseModel):
     """
     Complete employee model with all fields and validation.
     
     This model represents a full employee record as stored in the database.
     """
+    # Allow building directly from SQLAlchemy rows via model_validate()
+    model_config = ConfigDict(from_attributes=True)
+
     # Personal Information
     first_name: str = Field(
         min_length=1,
@@ -115,6 +138,14 @@ class Employee(DatabaseModel):
         description="Additional metadata about the employee"
     )
 
+    @field_validator('skills', 'additional_metadata', mode='before')
+    @classmethod
+    def empty_if_none(cls, v: Any, info: ValidationInfo) -> Any:
+        """Treat NULL JSON columns as empty collections."""
+        if v is None:
+            return [] if info.field_name == 'skills' else {}
+        return v
+
     @field_validator('birth_date')
     @classmethod
     def validate_birth_date(cls, v: Optional[date]) -> Optional[date]:
@@ -158,16 +189,7 @@ class Employee(DatabaseModel):
         if not v:
             return v
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in v:
-            skill = skill.strip()
-            if skill and skill.lower() not in seen:
-                seen.add(skill.lower())
-                unique_skills.append(skill)
-        
-        return unique_skills
+        return _unique_skills(v)
 
     @model_validator(mode='after')
     def validate_manager_not_self(self):
@@ -214,9 +236,21 @@ class Employee(DatabaseModel):
 
     def add_skill(self, skill: str) -> None:
         """Add a skill to the employee's skill set."""
-        skill = skill.strip()
-        if skill and skill.lower() not in [s.lower() for s in self.skills]:
-            self.skills.append(skill)
+        self.add_skills([skill])
+
+    def add_skills(self, skills: List[str]) -> None:
+        """Add several skills, skipping ones already present (case-insensitive)."""
+        known = {s.lower() for s in self.skills}
+        added = False
+        for skill in skills:
+            skill = skill.strip()
+            if skill and skill.lower() not in known:
+                known.add(skill.lower())
+                self.skills.append(skill)
+                added = True
+        
+        # Touch the timestamp once for the whole batch
+        if added:
             self.update_timestamp()
 
 
@@ -341,16 +375,7 @@ class EmployeeCreate(DatabaseModel):
         if not v:
             return v
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in v:
-            skill = skill.strip()
-            if skill and skill.lower() not in seen:
-                seen.add(skill.lower())
-                unique_skills.append(skill)
-        
-        return unique_skills
+        return _unique_skills(v)
 
 
 class EmployeeUpdate(DatabaseModel):
@@ -463,16 +488,11 @@ class EmployeeUpdate(DatabaseModel):
         if v is None or not v:
             return v
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in v:
-            skill = skill.strip()
-            if skill and skill.lower() not in seen:
-                seen.add(skill.lower())
-                unique_skills.append(skill)
-        
-        return unique_skills
+        return _unique_skills(v)
+
+
+# Fields withheld from public API output
+_SENSITIVE_FIELDS = frozenset({'salary', 'phone', 'birth_date'})
 
 
 class EmployeeResponse(Employee):
@@ -490,12 +510,8 @@ class EmployeeResponse(Employee):
         
     def to_public_dict(self) -> Dict[str, Any]:
         """Convert to dictionary without sensitive information."""
-        data = self.model_dump()
-        # Remove sensitive fields for public APIs
-        sensitive_fields = ['salary', 'phone', 'birth_date']
-        for field in sensitive_fields:
-            data.pop(field, None)
-        return data
+        # Leave sensitive fields out of the dump instead of popping them after
+        return self.model_dump(exclude=_SENSITIVE_FIELDS)
 
 
 # Example usage and factory functions
@@ -17,14 +17,33 @@ import os
 import subprocess
 import argparse
 import shutil
+from importlib.util import find_spec
 from pathlib import Path
 
 
+# Key packages checked for each version
+REQUIRED_MODULES = {
+    'basic': ('streamlit', 'pydantic'),
+    'intermediate': ('streamlit', 'pydantic', 'sqlalchemy', 'pandas', 'plotly'),
+    'advanced': ('streamlit', 'pydantic', 'sqlalchemy', 'pandas', 'plotly'),
+}
+
+
 def check_uv_available():
     """Check if uv is available on the system."""
     return shutil.which('uv') is not None
 
 
+def run_streaming(cmd):
+    """
+    Run a command with this process's stdout/stderr, so its output and
+    progress bars appear as they happen instead of after it finishes.
+    """
+    # Flush our own buffered messages so they appear before the command's output
+    sys.stdout.flush()
+    subprocess.run(cmd, check=True)
+
+
 def setup_environment(version: str, use_uv: bool = None):
     """Set up virtual environment and install dependencies."""
     
@@ -51,11 +70,11 @@ def setup_environment(version: str, use_uv: bool = None):
             venv_dir = Path('.venv')
             if not venv_dir.exists():
                 print("📦 Creating virtual environment...")
-                subprocess.run(['uv', 'venv'], check=True)
+                run_streaming(['uv', 'venv'])
             
             # Install dependencies with uv
             print("📥 Installing dependencies...")
-            subprocess.run(['uv', 'pip', 'install', '-r', 'requirements.txt'], check=True)
+            run_streaming(['uv', 'pip', 'install', '-r', 'requirements.txt'])
             
         else:
             print("🐌 Using traditional pip (slower - consider installing uv!)")
@@ -64,7 +83,7 @@ def setup_environment(version: str, use_uv: bool = None):
             venv_dir = Path('venv')
             if not venv_dir.exists():
                 print("📦 Creating virtual environment...")
-                subprocess.run([sys.executable, '-m', 'venv', 'venv'], check=True)
+                run_streaming([sys.executable, '-m', 'venv', 'venv'])
             
             # Install dependencies with pip
             print("📥 Installing dependencies...")
@@ -73,7 +92,7 @@ def setup_environment(version: str, use_uv: bool = None):
             else:
                 pip_path = venv_dir / 'bin' / 'pip'
             
-            subprocess.run([str(pip_path), 'install', '-r', 'requirements.txt'], check=True)
+            run_streaming([str(pip_path), 'install', '-r', 'requirements.txt'])
         
         print("✅ Environment setup complete!")
         return True
@@ -91,6 +110,30 @@ def setup_environment(version: str, use_uv: bool = None):
             return False
 
 
+# Streamlit command prefixes, resolved once per app directory
+_runner_cache = {}
+
+
+def resolve_runner(app_dir: Path):
+    """Return the command prefix that runs streamlit for an app directory."""
+    app_dir = app_dir.resolve()
+    if app_dir not in _runner_cache:
+        if check_uv_available() and (app_dir / '.venv').exists():
+            # Use uv to run streamlit in the virtual environment
+            runner = ['uv', 'run', 'streamlit', 'run']
+        elif (app_dir / 'venv').exists():
+            # Use traditional venv
+            bin_dir = 'Scripts' if sys.platform == 'win32' else 'bin'
+            python_path = app_dir / 'venv' / bin_dir / 'python'
+            runner = [str(python_path), '-m', 'streamlit', 'run']
+        else:
+            # Use system python (not recommended)
+            runner = [sys.executable, '-m', 'streamlit', 'run']
+        _runner_cache[app_dir] = runner
+    
+    return _runner_cache[app_dir]
+
+
 def run_streamlit_app(version: str, auto_setup: bool = True):
     """Run the Streamlit app for the specified version."""
     
@@ -143,25 +186,10 @@ def run_streamlit_app(version: str, auto_setup: bool = True):
             return False
         os.chdir(original_dir)
     
-    # Change to app directory and run streamlit
+    # Run streamlit from the app directory
     try:
-        os.chdir(app_dir)
-        
-        # Determine the python executable to use
-        use_uv = check_uv_available()
-        if use_uv and Path('.venv').exists():
-            # Use uv to run streamlit in the virtual environment
-            subprocess.run(['uv', 'run', 'streamlit', 'run', config['file']], check=True)
-        elif Path('venv').exists():
-            # Use traditional venv
-            if sys.platform == 'win32':
-                python_path = Path('venv') / 'Scripts' / 'python'
-            else:
-                python_path = Path('venv') / 'bin' / 'python'
-            subprocess.run([str(python_path), '-m', 'streamlit', 'run', config['file']], check=True)
-        else:
-            # Use system python (not recommended)
-            subprocess.run([sys.executable, '-m', 'streamlit', 'run', config['file']], check=True)
+        runner = resolve_runner(app_dir)
+        subprocess.run(runner + [config['file']], cwd=app_dir, check=True)
             
     except subprocess.CalledProcessError as e:
         print(f"❌ Error running Streamlit: {e}")
@@ -245,39 +273,23 @@ def check_dependencies(version: str):
     
     print(f"🔍 Checking dependencies for {version}...")
     
-    try:
-        # Try to import key packages based on version
-        if version == 'basic':
-            import streamlit
-            import pydantic
-            print("✅ Basic dependencies available")
-            
-        elif version == 'intermediate':
-            import streamlit
-            import pydantic
-            import sqlalchemy
-            import pandas
-            import plotly
-            print("✅ Intermediate dependencies available")
-            
-        elif version == 'advanced':
-            import streamlit
-            import pydantic
-            import sqlalchemy
-            import pandas
-            import plotly
-            print("✅ Advanced dependencies available")
-            
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    # Check key packages without importing them (importing plotly alone is slow)
+    missing = [
+        module for module in REQUIRED_MODULES.get(version, ())
+        if find_spec(module) is None
+    ]
+    
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         if check_uv_available():
             print(f"💡 Install with: uv pip install -r {requirements_file}")
         else:
             print(f"💡 Install with: pip install -r {requirements_file}")
         print(f"⚡ Or use the helper: python run_version.py {version.split('/')[-1]} (auto-setup)")
         return False
+    
+    print(f"✅ {version.title()} dependencies available")
+    return True
 
 
 def main():